@@ -5,15 +5,25 @@
 import os
 import shutil
 
+import epub_meta
 import pytest
 
 from path_to_csv import (
+    _EPUB_KEY_MAP,
     InformationExtractor,
+    _bytes_to_mb_string,
+    _fast_epub_meta,
     get_field_names,
     go_recursive,
     transform_to_mb,
 )
 
+EBOOK_PATHS = sorted(
+    os.path.join("tests", "ref", file_name)
+    for file_name in os.listdir(os.path.join("tests", "ref"))
+    if file_name.endswith(".epub")
+)
+
 
 class TestHanserDownload:
     """Class to test path_to_csv.py."""
@@ -79,9 +89,9 @@ class TestHanserDownload:
         test_information = self.extractor.get_information(self.test_folder_level1_1)
         assert isinstance(test_information, list)
         assert len(test_information) > 0
-        assert isinstance(test_information[0], dict)
-        assert "Pfad" in test_information[0]
-        assert os.path.basename(test_information[0]["Pfad"]) == "file_level1.txt"
+        assert isinstance(test_information[0], list)
+        assert self.extractor.field_names[0] == "Pfad"
+        assert os.path.basename(test_information[0][0]) == "file_level1.txt"
 
         test_information = self.extractor.get_information(self.test_folder_level2_1_1)
         assert isinstance(test_information, list)
@@ -98,12 +108,26 @@ class TestHanserDownload:
             os.path.abspath(os.path.join("tests", "ref"))
         )
         assert len(ebook_information) == 8
-        assert "epub_description" in ebook_information[0]
+        description_index = self.extractor.field_names.index("epub_description")
         assert (
-            ebook_information[0]["epub_description"]
+            ebook_information[0][description_index]
             == "Font rendering for multiple languages in a single ePub 3"
         )
 
+    @pytest.mark.parametrize("epub_path", EBOOK_PATHS, ids=os.path.basename)
+    def test_fast_epub_meta(self, epub_path: str):
+        """Tests that _fast_epub_meta matches epub_meta on the mapped keys."""
+        fast = _fast_epub_meta(epub_path)
+        reference = epub_meta.get_epub_metadata(epub_path, read_cover_image=False)
+        for pub_key in _EPUB_KEY_MAP:
+            if pub_key == "toc":
+                # Only the chapter titles end up in the CSV.
+                assert [entry["title"] for entry in fast["toc"]] == [
+                    entry["title"] for entry in reference["toc"]
+                ]
+            else:
+                assert fast[pub_key] == reference[pub_key]
+
     def test_transform_to_mb(self):
         """Tests transform_to_mb."""
         assert transform_to_mb("1,90 KB") == "0,01 MB"
@@ -111,6 +135,16 @@ class TestHanserDownload:
         assert transform_to_mb("3292429 Bytes") == "3,14 MB"
         assert transform_to_mb("156 PB") == "156 PB"
 
+    @pytest.mark.parametrize(
+        "size_in_bytes",
+        [0, 1, 60, 1024, 3292429, (1 << 20) - 1, 1 << 20, (1 << 20) + 1, 5 * (1 << 40)],
+    )
+    def test_bytes_to_mb_string(self, size_in_bytes: int):
+        """Tests that _bytes_to_mb_string matches transform_to_mb."""
+        assert _bytes_to_mb_string(size_in_bytes) == transform_to_mb(
+            f"{size_in_bytes} Bytes"
+        )
+
     def test_get_field_names(self):
         """Tests get_field_names."""
         all_files = [{"a": 1, "b": 2, "c": 3}, {"a": 1, "affe": 2}]